@@ -1,15 +1,44 @@
+import fastjsonschema
+import orjson
+import pytest
 import requests
-from requests.auth import HTTPBasicAuth
+import responses
 
 BASE_URL = "http://localhost:5174"
-AUTH_USERNAME = "admin@dudufisio.com"
-AUTH_PASSWORD = "demo123456"
 TIMEOUT = 30
-
-def test_get_all_patients_returns_list_with_correct_structure():
+PATIENTS = [
+    {
+        "id": "patient-1",
+        "name": "Test Patient",
+        "email": "test.patient@example.com",
+        "phone": "+5511999999999",
+        "birthDate": "1990-01-01",
+        "medicalHistory": ["No known allergies"]
+    }
+]
+# Required patient keys based on schema; medicalHistory is an array of strings, can be empty
+_EXPECTED_KEYS = ("id", "name", "email", "phone", "birthDate", "medicalHistory")
+PATIENT_SCHEMA = {
+    "type": "object",
+    "required": list(_EXPECTED_KEYS),
+    "properties": {
+        "id": {"type": "string"},
+        "name": {"type": "string"},
+        "email": {"type": "string"},
+        "phone": {"type": "string"},
+        "birthDate": {"type": "string"},
+        "medicalHistory": {"type": "array", "items": {"type": "string"}}
+    }
+}
+# Compiled once per module so each patient is checked by generated code
+validate_patient = fastjsonschema.compile(PATIENT_SCHEMA)
+
+@pytest.mark.contract
+def test_get_all_patients_returns_list_with_correct_structure(session, mock_api):
     url = f"{BASE_URL}/api/patients"
+    mock_api.add(responses.GET, url, json=PATIENTS, status=200)
     try:
-        response = requests.get(url, auth=HTTPBasicAuth(AUTH_USERNAME, AUTH_PASSWORD), timeout=TIMEOUT)
+        response = session.get(url, timeout=TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         assert False, f"HTTP request failed: {e}"
@@ -17,7 +46,7 @@ def test_get_all_patients_returns_list_with_correct_structure():
     assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
 
     try:
-        patients = response.json()
+        patients = orjson.loads(response.content)
     except ValueError:
         assert False, "Response is not valid JSON"
 
@@ -25,21 +54,7 @@ def test_get_all_patients_returns_list_with_correct_structure():
 
     # Validate structure of each patient object
     for patient in patients:
-        assert isinstance(patient, dict), f"Each patient should be a dict, got {type(patient)}"
-        # Required patient keys based on schema
-        expected_keys = {"id", "name", "email", "phone", "birthDate", "medicalHistory"}
-        patient_keys = set(patient.keys())
-        missing_keys = expected_keys - patient_keys
-        assert not missing_keys, f"Patient object missing keys: {missing_keys}"
-
-        assert isinstance(patient["id"], str), "Patient 'id' should be string"
-        assert isinstance(patient["name"], str), "Patient 'name' should be string"
-        assert isinstance(patient["email"], str), "Patient 'email' should be string"
-        assert isinstance(patient["phone"], str), "Patient 'phone' should be string"
-        assert isinstance(patient["birthDate"], str), "Patient 'birthDate' should be string"
-        # medicalHistory is an array of strings, can be empty
-        assert isinstance(patient["medicalHistory"], list), "Patient 'medicalHistory' should be a list"
-        for entry in patient["medicalHistory"]:
-            assert isinstance(entry, str), "Each entry in 'medicalHistory' should be a string"
-
-test_get_all_patients_returns_list_with_correct_structure()
\ No newline at end of file
+        try:
+            validate_patient(patient)
+        except fastjsonschema.JsonSchemaException as e:
+            assert False, f"Invalid patient object: {e.message}"
@@ -1,18 +1,13 @@
-import requests
-from requests.auth import HTTPBasicAuth
+import uuid
 
-BASE_URL = "http://localhost:5174"
-AUTH_USERNAME = "admin@dudufisio.com"
-AUTH_PASSWORD = "demo123456"
-HEADERS = {
-    "Content-Type": "application/json"
-}
-TIMEOUT = 30
+import pytest
 
-def test_create_new_patient_should_create_successfully():
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_new_patient_should_create_successfully(client):
     patient_data = {
         "name": "Test Patient",
-        "email": "test.patient@example.com",
+        "email": f"test.patient.{uuid.uuid4().hex}@example.com",
         "phone": "+5511999999999",
         "birthDate": "1990-01-01",
         "medicalHistory": [
@@ -24,29 +19,21 @@ def test_create_new_patient_should_create_successfully():
     created_patient_id = None
     try:
         # Create new patient
-        response = requests.post(
-            f"{BASE_URL}/api/patients",
-            json=patient_data,
-            headers=HEADERS,
-            auth=HTTPBasicAuth(AUTH_USERNAME, AUTH_PASSWORD),
-            timeout=TIMEOUT
+        response = await client.post(
+            "/api/patients",
+            json=patient_data
         )
 
         # Assert status code 201 Created
         assert response.status_code == 201, f"Expected status code 201, got {response.status_code}"
 
-        # Location header or ID in response might be used to get created patient id
-        # If no response body or location, fallback to GET all and find patient by unique email
-        if response.headers.get("Location"):
-            created_patient_id = response.headers.get("Location").rstrip("/").split("/")[-1]
-        else:
+        # The created patient is returned in the body; the Location header is the backup
+        # Only when both are missing, fallback to GET all and find patient by unique email
+        body = response.json() if response.content else {}
+        created_patient_id = body.get("id") or response.headers.get("Location", "").rstrip("/").split("/")[-1]
+        if not created_patient_id:
             # Try to get list of patients and find created one by email
-            list_response = requests.get(
-                f"{BASE_URL}/api/patients",
-                headers=HEADERS,
-                auth=HTTPBasicAuth(AUTH_USERNAME, AUTH_PASSWORD),
-                timeout=TIMEOUT
-            )
+            list_response = await client.get("/api/patients")
             assert list_response.status_code == 200, f"Expected status code 200 listing patients, got {list_response.status_code}"
             patients = list_response.json()
             found_patients = [p for p in patients if p.get("email") == patient_data["email"]]
@@ -54,12 +41,7 @@ def test_create_new_patient_should_create_successfully():
             created_patient_id = found_patients[0]["id"]
 
         # Verify the created patient details by GET
-        get_response = requests.get(
-            f"{BASE_URL}/api/patients/{created_patient_id}",
-            headers=HEADERS,
-            auth=HTTPBasicAuth(AUTH_USERNAME, AUTH_PASSWORD),
-            timeout=TIMEOUT
-        )
+        get_response = await client.get(f"/api/patients/{created_patient_id}")
         assert get_response.status_code == 200, f"Expected status code 200 on GET patient, got {get_response.status_code}"
         patient = get_response.json()
         assert patient["name"] == patient_data["name"], "Patient name mismatch"
@@ -72,14 +54,7 @@ def test_create_new_patient_should_create_successfully():
         # Cleanup: delete the created patient if ID is known
         if created_patient_id:
             try:
-                delete_response = requests.delete(
-                    f"{BASE_URL}/api/patients/{created_patient_id}",
-                    headers=HEADERS,
-                    auth=HTTPBasicAuth(AUTH_USERNAME, AUTH_PASSWORD),
-                    timeout=TIMEOUT
-                )
+                delete_response = await client.delete(f"/api/patients/{created_patient_id}")
                 # Not asserting delete status, just attempt cleanup
             except Exception:
                 pass
-
-test_create_new_patient_should_create_successfully()
\ No newline at end of file
@@ -1,22 +1,45 @@
+import orjson
+import pytest
 import requests
-from requests.auth import HTTPBasicAuth
+import responses
+from responses import matchers
 
 BASE_URL = "http://localhost:5174"
 TIMEOUT = 30
-AUTH = HTTPBasicAuth("admin@dudufisio.com", "demo123456")
 HEADERS = {
     "Accept": "application/json"
 }
+APPOINTMENTS = [
+    {
+        "id": "appointment-1",
+        "patientId": "patient-1",
+        "date": "2025-06-10",
+        "startTime": "2025-06-10T10:00:00",
+        "endTime": "2025-06-10T10:30:00"
+    }
+]
 
-def test_get_appointments_filtered_by_date():
+@pytest.mark.contract
+def test_get_appointments_filtered_by_date(session, mock_api):
     params = {
         "startDate": "2025-01-01",
         "endDate": "2025-12-31"
     }
+    # Only answers when the client actually sends the date filters
+    mock_api.add(
+        responses.GET,
+        f"{BASE_URL}/api/appointments",
+        json=APPOINTMENTS,
+        status=200,
+        match=[matchers.query_param_matcher(params)]
+    )
     try:
-        response = requests.get(f"{BASE_URL}/api/appointments", auth=AUTH, headers=HEADERS, params=params, timeout=TIMEOUT)
+        response = session.get(f"{BASE_URL}/api/appointments", headers=HEADERS, params=params, timeout=TIMEOUT)
         assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
-        appointments = response.json()
+        try:
+            appointments = orjson.loads(response.content)
+        except ValueError:
+            assert False, "Response is not valid JSON"
         assert isinstance(appointments, list), "Response is not a list"
         # Optional: Validate each appointment has expected keys (basic schema validation)
         if appointments:
@@ -29,5 +52,3 @@ def test_get_appointments_filtered_by_date():
             assert date_field_found, "No date field found in appointment to validate filtering"
     except requests.RequestException as e:
         assert False, f"Request failed: {e}"
-
-test_get_appointments_filtered_by_date()
\ No newline at end of file
@@ -1,11 +1,12 @@
-import requests
-from requests.auth import HTTPBasicAuth
+import datetime
+import uuid
+from datetime import timedelta
 
-BASE_URL = "http://localhost:5174"
-AUTH = HTTPBasicAuth('admin@dudufisio.com', 'demo123456')
-TIMEOUT = 30
+import pytest
 
-def test_create_new_appointment():
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_new_appointment(client):
     # Sample payload for creating an appointment
     # Appointment schema details are limited; assuming minimal required fields
     # We'll create a patient first to have a valid patientId for the appointment
@@ -13,24 +14,18 @@ def test_create_new_appointment():
     # Step 1: Create a patient to link appointment
     patient_payload = {
         "name": "Test Patient for Appointment",
-        "email": "test.patient.appointment@example.com",
+        "email": f"test.patient.appointment.{uuid.uuid4().hex}@example.com",
         "phone": "+5511999999999",
         "birthDate": "1990-01-01",
         "medicalHistory": []
     }
     patient_id = None
     appointment_id = None
-    headers = {
-        "Content-Type": "application/json"
-    }
 
     try:
-        patient_response = requests.post(
-            f"{BASE_URL}/api/patients",
-            json=patient_payload,
-            auth=AUTH,
-            headers=headers,
-            timeout=TIMEOUT
+        patient_response = await client.post(
+            "/api/patients",
+            json=patient_payload
         )
         assert patient_response.status_code == 201, f"Failed to create patient, status code: {patient_response.status_code}"
         # Try to get patient ID from location header or response body
@@ -51,28 +46,21 @@ def test_create_new_appointment():
         # Assuming the appointment schema minimally includes patientId, date, time, and therapistId (if required)
         # As full schema is not available, we'll use typical fields
         # Use a datetime in the future for the appointment
-
-        import datetime
-        from datetime import timedelta
-
-        start_datetime = (datetime.datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+        start_datetime = datetime.datetime.now().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
         end_datetime = start_datetime + timedelta(minutes=30)
 
         appointment_payload = {
             "patientId": patient_id,
-            "startTime": start_datetime.isoformat(),
-            "endTime": end_datetime.isoformat(),
+            "startTime": start_datetime.isoformat(timespec="seconds"),
+            "endTime": end_datetime.isoformat(timespec="seconds"),
             "notes": "Test appointment creation",
             # adding dummy therapistId if needed - since schema unclear we leave it out or add a placeholder
             # "therapistId": "therapist-1234"
         }
 
-        appointment_response = requests.post(
-            f"{BASE_URL}/api/appointments",
-            json=appointment_payload,
-            auth=AUTH,
-            headers=headers,
-            timeout=TIMEOUT
+        appointment_response = await client.post(
+            "/api/appointments",
+            json=appointment_payload
         )
         assert appointment_response.status_code == 201, f"Appointment creation failed with status {appointment_response.status_code}"
 
@@ -91,22 +79,12 @@ def test_create_new_appointment():
         # Cleanup created appointment if possible
         if appointment_id:
             try:
-                requests.delete(
-                    f"{BASE_URL}/api/appointments/{appointment_id}",
-                    auth=AUTH,
-                    timeout=TIMEOUT
-                )
+                await client.delete(f"/api/appointments/{appointment_id}")
             except Exception:
                 pass
         # Cleanup created patient
         if patient_id:
             try:
-                requests.delete(
-                    f"{BASE_URL}/api/patients/{patient_id}",
-                    auth=AUTH,
-                    timeout=TIMEOUT
-                )
+                await client.delete(f"/api/patients/{patient_id}")
             except Exception:
                 pass
-
-test_create_new_appointment()
\ No newline at end of file
@@ -1,12 +1,24 @@
+import orjson
+import pytest
 import requests
-from requests.auth import HTTPBasicAuth
+import responses
+from responses import matchers
 
-def test_get_exercises_filtered():
+EXERCISES = [
+    {
+        "id": "exercise-1",
+        "name": "Squat",
+        "category": "strength",
+        "specialty": "orthopedic"
+    }
+]
+
+@pytest.mark.contract
+def test_get_exercises_filtered(session, mock_api):
     base_url = "http://localhost:5174"
     endpoint = "/api/exercises"
     url = base_url + endpoint
 
-    auth = HTTPBasicAuth("admin@dudufisio.com", "demo123456")
     headers = {
         "Accept": "application/json"
     }
@@ -16,15 +28,17 @@ def test_get_exercises_filtered():
         "category": "strength",
         "specialty": "orthopedic"
     }
+    # Only answers when the client actually sends the filters
+    mock_api.add(responses.GET, url, json=EXERCISES, status=200, match=[matchers.query_param_matcher(params)])
 
     try:
-        response = requests.get(url, headers=headers, params=params, auth=auth, timeout=30)
+        response = session.get(url, headers=headers, params=params, timeout=30)
     except requests.RequestException as e:
         assert False, f"Request failed: {e}"
 
     assert response.status_code == 200, f"Expected status code 200 but got {response.status_code}"
     try:
-        exercises = response.json()
+        exercises = orjson.loads(response.content)
     except ValueError:
         assert False, "Response is not valid JSON"
 
@@ -40,5 +54,3 @@ def test_get_exercises_filtered():
         # Verify specialty filter is respected if specialty is present
         if "specialty" in exercise:
             assert exercise["specialty"] == params["specialty"], f"Exercise specialty {exercise.get('specialty')} does not match filter {params['specialty']}"
-
-test_get_exercises_filtered()
\ No newline at end of file
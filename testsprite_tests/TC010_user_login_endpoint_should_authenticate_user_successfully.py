@@ -1,13 +1,18 @@
+import pytest
 import requests
+import responses
 
 base_url = "http://localhost:5174"
 timeout = 30
+login_response = {
+    "user": {"id": "user-1", "email": "admin@dudufisio.com", "role": "admin"},
+    "token": "test-token"
+}
 
-def test_user_login_endpoint_should_authenticate_user_successfully():
+@pytest.mark.contract
+def test_user_login_endpoint_should_authenticate_user_successfully(session, mock_api):
     url = f"{base_url}/api/auth/login"
-    headers = {
-        "Content-Type": "application/json"
-    }
+    mock_api.add(responses.POST, url, json=login_response, status=200)
     # Use credentials from instructions (admin@dudufisio.com / demo123456)
     payload = {
         "email": "admin@dudufisio.com",
@@ -15,7 +20,7 @@ def test_user_login_endpoint_should_authenticate_user_successfully():
     }
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=timeout)
+        response = session.post(url, json=payload, timeout=timeout)
     except requests.RequestException as e:
         assert False, f"Request failed: {e}"
 
@@ -39,5 +44,3 @@ def test_user_login_endpoint_should_authenticate_user_successfully():
     user = data["user"]
     assert "email" in user, "'email' missing in user details"
     assert user["email"].lower() == payload["email"].lower(), "Returned user email does not match login email"
-
-test_user_login_endpoint_should_authenticate_user_successfully()
\ No newline at end of file
@@ -0,0 +1,106 @@
+import base64
+import uuid
+import warnings
+
+import httpx
+import pytest
+import pytest_asyncio
+import requests
+import responses
+from requests.adapters import HTTPAdapter
+
+AUTH_USERNAME = "admin@dudufisio.com"
+AUTH_PASSWORD = "demo123456"
+BASE_URL = "http://localhost:5174"
+TIMEOUT = 30
+# Encoded once instead of letting HTTPBasicAuth rebuild it on every request
+_AUTH_HEADER = "Basic " + base64.b64encode(f"{AUTH_USERNAME}:{AUTH_PASSWORD}".encode()).decode()
+_LOGIN_PAYLOAD = {"email": AUTH_USERNAME, "password": AUTH_PASSWORD}
+
+
+def _new_session():
+    # Pooled, keep-alive session with the default JSON and Basic auth headers
+    s = requests.Session()
+    s.headers.update({"Content-Type": "application/json", "Authorization": _AUTH_HEADER})
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+    s.mount("http://", adapter)
+    return s
+
+
+@pytest.fixture(scope="session")
+def session():
+    # Shared Basic auth session for tests that do not log in
+    s = _new_session()
+    yield s
+    s.close()
+
+
+@pytest.fixture(scope="session")
+def auth_token(session):
+    # Log in once and reuse the token, so the server skips password checks per request
+    response = session.post(
+        f"{BASE_URL}/api/auth/login",
+        json=_LOGIN_PAYLOAD,
+        timeout=TIMEOUT
+    )
+    assert response.status_code == 200, f"Login failed with status {response.status_code}"
+    return response.json()["token"]
+
+
+@pytest.fixture(scope="session")
+def authed_session(auth_token):
+    s = _new_session()
+    s.headers["Authorization"] = f"Bearer {auth_token}"
+    yield s
+    s.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    # One pooled async client per worker for the integration chains, logged in once
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT) as c:
+        response = await c.post("/api/auth/login", json=_LOGIN_PAYLOAD)
+        assert response.status_code == 200, f"Login failed with status {response.status_code}"
+        c.headers["Authorization"] = f"Bearer {response.json()['token']}"
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_patient(client):
+    # One patient reused by the read-only integration tests, created once per worker
+    patient_data = {
+        "name": "Test Patient",
+        "email": f"test.patient.{uuid.uuid4().hex}@example.com",
+        "phone": "123456789",
+        "birthDate": "1990-01-01",
+        "medicalHistory": ["None"]
+    }
+    create_response = await client.post("/api/patients", json=patient_data)
+    assert create_response.status_code == 201, f"Expected status code 201 on patient creation, got {create_response.status_code}"
+
+    # The created patient is returned in the body; only a 201 without body needs a lookup
+    if create_response.content:
+        patient_id = create_response.json().get("id")
+    else:
+        warnings.warn("Patient creation returned 201 without a body; falling back to Location header or email lookup")
+        patient_id = create_response.headers.get("Location", "").rstrip("/").split("/")[-1]
+        if not patient_id:
+            # Get the list of patients to retrieve the created patient's ID
+            list_response = await client.get("/api/patients")
+            assert list_response.status_code == 200, f"Expected status code 200 getting patients list, got {list_response.status_code}"
+            matching_patients = [p for p in list_response.json() if p.get("email") == patient_data["email"]]
+            assert len(matching_patients) == 1, f"Expected exactly one patient with email {patient_data['email']}, found {len(matching_patients)}"
+            patient_id = matching_patients[0].get("id")
+    assert patient_id, "Patient ID not found after creation"
+
+    yield {**patient_data, "id": patient_id}
+
+    # Cleanup - delete the shared patient
+    await client.delete(f"/api/patients/{patient_id}")
+
+
+@pytest.fixture
+def mock_api():
+    # Stub the HTTP layer so contract tests run without the dev server
+    with responses.RequestsMock() as rsps:
+        yield rsps
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
+
+BASE_URL = "http://localhost:5174"
+TIMEOUT = 30
+READONLY_REQUESTS = [
+    ("/api/patients", None),
+    ("/api/appointments", {"startDate": "2025-01-01", "endDate": "2025-12-31"}),
+    ("/api/medical-records", None),
+    ("/api/exercises", {"category": "strength", "specialty": "orthopedic"}),
+]
+
+@pytest.mark.smoke
+def test_readonly_endpoints_respond_in_parallel(authed_session):
+    # Same GETs as TC001/TC004/TC006/TC009, fired concurrently over the session's connection pool
+    with ThreadPoolExecutor(max_workers=len(READONLY_REQUESTS)) as ex:
+        futs = {
+            ex.submit(authed_session.get, f"{BASE_URL}{path}", params=params, timeout=TIMEOUT): path
+            for path, params in READONLY_REQUESTS
+        }
+
+    for fut, path in futs.items():
+        response = fut.result()
+        assert response.status_code == 200, f"Expected status code 200 for {path}, got {response.status_code}"
+        try:
+            data = orjson.loads(response.content)
+        except ValueError:
+            assert False, f"Response for {path} is not valid JSON"
+        assert isinstance(data, list), f"Expected {path} to return a list, got {type(data).__name__}"